@@ -38,9 +38,11 @@ class RpkTool:
     def __init__(self, redpanda):
         self._redpanda = redpanda
 
-    def create_topic(self, topic, partitions=1):
+    def create_topic(self, topic, partitions=1, replicas=None):
         cmd = ["create", topic]
         cmd += ["--partitions", str(partitions)]
+        if replicas is not None:
+            cmd += ["--replicas", str(replicas)]
         return self._run_topic(cmd)
 
     def list_topics(self):
@@ -8,21 +8,25 @@
 # by the Apache License, Version 2.0
 
 import http.client
-import json
 import logging
-import uuid
+import orjson
+import os
 import requests
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from requests.adapters import HTTPAdapter
 from ducktape.mark.resource import cluster
 from ducktape.utils.util import wait_until
 
 from rptest.clients.types import TopicSpec
 from rptest.clients.kafka_cat import KafkaCat
-from rptest.clients.kafka_cli_tools import KafkaCliTools
+from rptest.clients.rpk import RpkTool
 from rptest.tests.redpanda_test import RedpandaTest
 
 
 def create_topic_names(count):
-    return list(f"pandaproxy-topic-{uuid.uuid4()}" for _ in range(count))
+    return [f"pandaproxy-topic-{secrets.token_hex(8)}" for _ in range(count)]
 
 
 HTTP_GET_HEADERS = {"Accept": "application/vnd.schemaregistry.v1+json"}
@@ -36,6 +40,33 @@ schema1_def = '{"type":"record","name":"myrecord","fields":[{"type":"string","na
 schema2_def = '{"type":"record","name":"myrecord","fields":[{"type":"string","name":"f1"},{"type":"string","name":"f2","default":"foo"}]}'
 schema3_def = '{"type":"record","name":"myrecord","fields":[{"type":"string","name":"f1"},{"type":"string","name":"f2"}]}'
 
+# Request bodies are encoded once and reused for every registration
+schema1_data = orjson.dumps({"schema": schema1_def})
+schema2_data = orjson.dumps({"schema": schema2_def})
+schema3_data = orjson.dumps({"schema": schema3_def})
+
+_logging_initialized = False
+
+
+def _init_logging():
+    """
+    Configure logging once per process rather than once per test instance.
+    """
+    global _logging_initialized
+    if _logging_initialized:
+        return
+
+    logging.basicConfig()
+    # Wire level logging of every request and response is expensive,
+    # only enable it when explicitly asked for
+    if os.environ.get("RPTEST_HTTP_DEBUG"):
+        http.client.HTTPConnection.debuglevel = 1
+        requests_log = logging.getLogger("requests.packages.urllib3")
+        requests_log.setLevel(logging.getLogger().level)
+        requests_log.propagate = True
+
+    _logging_initialized = True
+
 
 class SchemaRegistryTest(RedpandaTest):
     """
@@ -50,92 +81,107 @@ class SchemaRegistryTest(RedpandaTest):
             extra_rp_conf={"auto_create_topics_enabled": False},
             num_cores=1)
 
-        http.client.HTTPConnection.debuglevel = 1
-        logging.basicConfig()
-        requests_log = logging.getLogger("requests.packages.urllib3")
-        requests_log.setLevel(logging.getLogger().level)
-        requests_log.propagate = True
-
-    def _base_uri(self):
-        return f"http://{self.redpanda.nodes[0].account.hostname}:8081"
-
-    def _get_topics(self):
-        return requests.get(
-            f"http://{self.redpanda.nodes[0].account.hostname}:8082/topics")
+        _init_logging()
+
+        # Share one keep-alive connection pool across all requests made by
+        # a test rather than opening a new connection per request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._pool = ThreadPoolExecutor(max_workers=8)
+        self._rpk_tool = RpkTool(self.redpanda)
+
+        # The cluster nodes are allocated by now, so resolve the endpoints
+        # once rather than on every request.
+        hostname = self.redpanda.nodes[0].account.hostname
+        self._base = f"http://{hostname}:8081"
+        self._urls = {
+            "config": f"{self._base}/config",
+            "schemas_types": f"{self._base}/schemas/types",
+            "schemas_ids": f"{self._base}/schemas/ids",
+            "subjects": f"{self._base}/subjects",
+            "compatibility": f"{self._base}/compatibility/subjects",
+        }
+
+    def tearDown(self):
+        self._pool.shutdown()
+        self._session.close()
+        super().tearDown()
 
     def _create_topics(self,
-                       names=create_topic_names(1),
+                       names=None,
                        partitions=1,
                        replicas=1,
                        cleanup_policy=TopicSpec.CLEANUP_DELETE):
+        if names is None:
+            names = create_topic_names(1)
         self.logger.debug(f"Creating topics: {names}")
-        kafka_tools = KafkaCliTools(self.redpanda)
-        for name in names:
-            kafka_tools.create_topic(
-                TopicSpec(name=name,
-                          partition_count=partitions,
-                          replication_factor=replicas))
-        assert set(names).issubset(self._get_topics().json())
+        # rpk takes a single topic per invocation, so create them concurrently
+        create_topic = partial(self._rpk_tool.create_topic,
+                               partitions=partitions,
+                               replicas=replicas)
+        list(self._pool.map(create_topic, names))
+        assert set(names).issubset(self._rpk_tool.list_topics())
         return names
 
     def _get_config(self, headers=HTTP_GET_HEADERS):
-        return requests.get(f"{self._base_uri()}/config", headers=headers)
+        return self._session.get(self._urls["config"], headers=headers)
 
     def _set_config(self, data, headers=HTTP_POST_HEADERS):
-        return requests.put(f"{self._base_uri()}/config",
-                            headers=headers,
-                            data=data)
+        return self._session.put(self._urls["config"],
+                                 headers=headers,
+                                 data=data)
 
     def _get_config_subject(self, subject, headers=HTTP_GET_HEADERS):
-        return requests.get(f"{self._base_uri()}/config/{subject}",
-                            headers=headers)
+        return self._session.get(f"{self._urls['config']}/{subject}",
+                                 headers=headers)
 
     def _set_config_subject(self, subject, data, headers=HTTP_POST_HEADERS):
-        return requests.put(f"{self._base_uri()}/config/{subject}",
-                            headers=headers,
-                            data=data)
+        return self._session.put(f"{self._urls['config']}/{subject}",
+                                 headers=headers,
+                                 data=data)
 
     def _get_schemas_types(self, headers=HTTP_GET_HEADERS):
-        return requests.get(f"{self._base_uri()}/schemas/types",
-                            headers=headers)
+        return self._session.get(self._urls["schemas_types"], headers=headers)
 
     def _get_schemas_ids_id(self, id, headers=HTTP_GET_HEADERS):
-        return requests.get(f"{self._base_uri()}/schemas/ids/{id}",
-                            headers=headers)
+        return self._session.get(f"{self._urls['schemas_ids']}/{id}",
+                                 headers=headers)
 
     def _get_subjects(self, headers=HTTP_GET_HEADERS):
-        return requests.get(f"{self._base_uri()}/subjects", headers=headers)
+        return self._session.get(self._urls["subjects"], headers=headers)
 
     def _post_subjects_subject_versions(self,
                                         subject,
                                         data,
                                         headers=HTTP_POST_HEADERS):
-        return requests.post(f"{self._base_uri()}/subjects/{subject}/versions",
-                             headers=headers,
-                             data=data)
+        return self._session.post(
+            f"{self._urls['subjects']}/{subject}/versions",
+            headers=headers,
+            data=data)
 
     def _get_subjects_subject_versions_version(self,
                                                subject,
                                                version,
                                                headers=HTTP_GET_HEADERS):
-        return requests.get(
-            f"{self._base_uri()}/subjects/{subject}/versions/{version}",
+        return self._session.get(
+            f"{self._urls['subjects']}/{subject}/versions/{version}",
             headers=headers)
 
     def _get_subjects_subject_versions(self,
                                        subject,
                                        deleted=False,
                                        headers=HTTP_GET_HEADERS):
-        return requests.get(
-            f"{self._base_uri()}/subjects/{subject}/versions{'?deleted=true' if deleted else ''}",
+        return self._session.get(
+            f"{self._urls['subjects']}/{subject}/versions{'?deleted=true' if deleted else ''}",
             headers=headers)
 
     def _delete_subject(self,
                         subject,
                         permanent=False,
                         headers=HTTP_GET_HEADERS):
-        return requests.delete(
-            f"{self._base_uri()}/subjects/{subject}{'?permanent=true' if permanent else ''}",
+        return self._session.delete(
+            f"{self._urls['subjects']}/{subject}{'?permanent=true' if permanent else ''}",
             headers=headers)
 
     def _delete_subject_version(self,
@@ -143,8 +189,8 @@ class SchemaRegistryTest(RedpandaTest):
                                 version,
                                 permanent=False,
                                 headers=HTTP_GET_HEADERS):
-        return requests.delete(
-            f"{self._base_uri()}/subjects/{subject}/versions/{version}{'?permanent=true' if permanent else ''}",
+        return self._session.delete(
+            f"{self._urls['subjects']}/{subject}/versions/{version}{'?permanent=true' if permanent else ''}",
             headers=headers)
 
     def _post_compatibility_subject_version(self,
@@ -152,11 +198,18 @@ class SchemaRegistryTest(RedpandaTest):
                                             version,
                                             data,
                                             headers=HTTP_POST_HEADERS):
-        return requests.post(
-            f"{self._base_uri()}/compatibility/subjects/{subject}/versions/{version}",
+        return self._session.post(
+            f"{self._urls['compatibility']}/{subject}/versions/{version}",
             headers=headers,
             data=data)
 
+    def _concurrently(self, calls):
+        """
+        Issue independent, read-only requests concurrently over the shared
+        session. Responses are returned in the order of the calls.
+        """
+        return list(self._pool.map(lambda call: call(), calls))
+
     @cluster(num_nodes=3)
     def test_schemas_types(self):
         """
@@ -169,7 +222,7 @@ class SchemaRegistryTest(RedpandaTest):
         self.logger.debug(f"Request schema types with defautl accept header")
         result_raw = self._get_schemas_types()
         assert result_raw.status_code == requests.codes.ok
-        result = result_raw.json()
+        result = orjson.loads(result_raw.content)
         assert result == ["AVRO"]
 
     @cluster(num_nodes=3)
@@ -180,104 +233,122 @@ class SchemaRegistryTest(RedpandaTest):
 
         topic = create_topic_names(1)[0]
 
-        self.logger.debug(f"Register a schema against a subject")
-        schema_1_data = json.dumps({"schema": schema1_def})
-
         self.logger.debug("Get empty subjects")
         result_raw = self._get_subjects()
-        assert result_raw.json() == []
+        assert orjson.loads(result_raw.content) == []
 
         self.logger.debug("Posting schema 1 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
+            subject=f"{topic}-key", data=schema1_data)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
-        assert result_raw.json()["id"] == 1
+        assert orjson.loads(result_raw.content)["id"] == 1
 
         self.logger.debug("Reposting schema 1 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
+            subject=f"{topic}-key", data=schema1_data)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
-        assert result_raw.json()["id"] == 1
+        assert orjson.loads(result_raw.content)["id"] == 1
 
         self.logger.debug("Reposting schema 1 as a subject value")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-value", data=schema_1_data)
+            subject=f"{topic}-value", data=schema1_data)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
-        assert result_raw.json()["id"] == 1
+        assert orjson.loads(result_raw.content)["id"] == 1
+
+        self.logger.debug("Verify subjects, versions and schemas")
+        (subjects, invalid_subject_versions, key_versions, value_versions,
+         invalid_subject_version, key_invalid_version, key_version_1,
+         key_version_latest, invalid_schema, schema_1) = self._concurrently([
+             self._get_subjects,
+             partial(self._get_subjects_subject_versions,
+                     subject=f"{topic}-invalid"),
+             partial(self._get_subjects_subject_versions,
+                     subject=f"{topic}-key"),
+             partial(self._get_subjects_subject_versions,
+                     subject=f"{topic}-value"),
+             partial(self._get_subjects_subject_versions_version,
+                     subject=f"{topic}-invalid",
+                     version=1),
+             partial(self._get_subjects_subject_versions_version,
+                     subject=f"{topic}-key",
+                     version=2),
+             partial(self._get_subjects_subject_versions_version,
+                     subject=f"{topic}-key",
+                     version=1),
+             partial(self._get_subjects_subject_versions_version,
+                     subject=f"{topic}-key",
+                     version="latest"),
+             partial(self._get_schemas_ids_id, id=2),
+             partial(self._get_schemas_ids_id, id=1),
+         ])
 
         self.logger.debug("Get subjects")
-        result_raw = self._get_subjects()
-        assert set(result_raw.json()) == {f"{topic}-key", f"{topic}-value"}
+        result_raw = subjects
+        assert set(orjson.loads(
+            result_raw.content)) == {f"{topic}-key", f"{topic}-value"}
 
         self.logger.debug("Get schema versions for invalid subject")
-        result_raw = self._get_subjects_subject_versions(
-            subject=f"{topic}-invalid")
+        result_raw = invalid_subject_versions
         assert result_raw.status_code == requests.codes.not_found
-        result = result_raw.json()
+        result = orjson.loads(result_raw.content)
         assert result["error_code"] == 40401
         assert result["message"] == f"Subject '{topic}-invalid' not found."
 
         self.logger.debug("Get schema versions for subject key")
-        result_raw = self._get_subjects_subject_versions(
-            subject=f"{topic}-key")
+        result_raw = key_versions
         assert result_raw.status_code == requests.codes.ok
-        assert result_raw.json() == [1]
+        assert orjson.loads(result_raw.content) == [1]
 
         self.logger.debug("Get schema versions for subject value")
-        result_raw = self._get_subjects_subject_versions(
-            subject=f"{topic}-value")
+        result_raw = value_versions
         assert result_raw.status_code == requests.codes.ok
-        assert result_raw.json() == [1]
+        assert orjson.loads(result_raw.content) == [1]
 
         self.logger.debug("Get schema version 1 for invalid subject")
-        result_raw = self._get_subjects_subject_versions_version(
-            subject=f"{topic}-invalid", version=1)
+        result_raw = invalid_subject_version
         assert result_raw.status_code == requests.codes.not_found
-        result = result_raw.json()
+        result = orjson.loads(result_raw.content)
         assert result["error_code"] == 40401
         assert result["message"] == f"Subject '{topic}-invalid' not found."
 
         self.logger.debug("Get invalid schema version for subject")
-        result_raw = self._get_subjects_subject_versions_version(
-            subject=f"{topic}-key", version=2)
+        result_raw = key_invalid_version
         assert result_raw.status_code == requests.codes.not_found
-        result = result_raw.json()
+        result = orjson.loads(result_raw.content)
         assert result["error_code"] == 40401
         assert result[
             "message"] == f"Subject '{topic}-key' Version 2 not found."
 
         self.logger.debug("Get schema version 1 for subject key")
-        result_raw = self._get_subjects_subject_versions_version(
-            subject=f"{topic}-key", version=1)
+        result_raw = key_version_1
         assert result_raw.status_code == requests.codes.ok
-        result = result_raw.json()
+        result = orjson.loads(result_raw.content)
         assert result["name"] == f"{topic}-key"
         assert result["version"] == 1
         # assert result["schema"] == json.dumps(schema_def)
 
         self.logger.debug("Get latest schema version for subject key")
-        result_raw = self._get_subjects_subject_versions_version(
-            subject=f"{topic}-key", version="latest")
+        result_raw = key_version_latest
         assert result_raw.status_code == requests.codes.ok
-        result = result_raw.json()
+        result = orjson.loads(result_raw.content)
         assert result["name"] == f"{topic}-key"
         assert result["version"] == 1
         # assert result["schema"] == json.dumps(schema_def)
 
         self.logger.debug("Get invalid schema version")
-        result_raw = self._get_schemas_ids_id(id=2)
+        result_raw = invalid_schema
         assert result_raw.status_code == requests.codes.not_found
-        result = result_raw.json()
+        result = orjson.loads(result_raw.content)
         assert result["error_code"] == 40401
         assert result["message"] == "Schema 2 not found"
 
         self.logger.debug("Get schema version 1")
-        result_raw = self._get_schemas_ids_id(id=1)
+        result_raw = schema_1
         assert result_raw.status_code == requests.codes.ok
-        result = result_raw.json()
+        result = orjson.loads(result_raw.content)
         # assert result["schema"] == json.dumps(schema_def)
 
     @cluster(num_nodes=3)
@@ -287,39 +358,39 @@ class SchemaRegistryTest(RedpandaTest):
         """
         self.logger.debug("Get initial global config")
         result_raw = self._get_config()
-        assert result_raw.json()["compatibilityLevel"] == "NONE"
+        assert orjson.loads(result_raw.content)["compatibilityLevel"] == "NONE"
 
         self.logger.debug("Set global config")
         result_raw = self._set_config(
-            data=json.dumps({"compatibility": "FULL"}))
-        assert result_raw.json()["compatibility"] == "FULL"
+            data=orjson.dumps({"compatibility": "FULL"}))
+        assert orjson.loads(result_raw.content)["compatibility"] == "FULL"
 
         self.logger.debug("Get invalid subject config")
         result_raw = self._get_config_subject(subject="invalid_subject")
         assert result_raw.status_code == requests.codes.not_found
-        assert result_raw.json()["error_code"] == 40401
-
-        schema_1_data = json.dumps({"schema": schema1_def})
+        assert orjson.loads(result_raw.content)["error_code"] == 40401
 
         topic = create_topic_names(1)[0]
 
         self.logger.debug("Posting schema 1 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
+            subject=f"{topic}-key", data=schema1_data)
 
         self.logger.debug("Get subject config - should be same as global")
         result_raw = self._get_config_subject(subject=f"{topic}-key")
-        assert result_raw.json()["compatibilityLevel"] == "FULL"
+        assert orjson.loads(result_raw.content)["compatibilityLevel"] == "FULL"
 
         self.logger.debug("Set subject config")
         result_raw = self._set_config_subject(
             subject=f"{topic}-key",
-            data=json.dumps({"compatibility": "BACKWARD_TRANSITIVE"}))
-        assert result_raw.json()["compatibility"] == "BACKWARD_TRANSITIVE"
+            data=orjson.dumps({"compatibility": "BACKWARD_TRANSITIVE"}))
+        assert orjson.loads(
+            result_raw.content)["compatibility"] == "BACKWARD_TRANSITIVE"
 
         self.logger.debug("Get subject config - should be overriden")
         result_raw = self._get_config_subject(subject=f"{topic}-key")
-        assert result_raw.json()["compatibilityLevel"] == "BACKWARD_TRANSITIVE"
+        assert orjson.loads(
+            result_raw.content)["compatibilityLevel"] == "BACKWARD_TRANSITIVE"
 
     @cluster(num_nodes=3)
     def test_post_compatibility_subject_version(self):
@@ -329,46 +400,41 @@ class SchemaRegistryTest(RedpandaTest):
 
         topic = create_topic_names(1)[0]
 
-        self.logger.debug(f"Register a schema against a subject")
-        schema_1_data = json.dumps({"schema": schema1_def})
-        schema_2_data = json.dumps({"schema": schema2_def})
-        schema_3_data = json.dumps({"schema": schema3_def})
-
         self.logger.debug("Posting schema 1 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
+            subject=f"{topic}-key", data=schema1_data)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Set subject config - NONE")
         result_raw = self._set_config_subject(subject=f"{topic}-key",
-                                              data=json.dumps(
+                                              data=orjson.dumps(
                                                   {"compatibility": "NONE"}))
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Check compatibility none, no default")
         result_raw = self._post_compatibility_subject_version(
-            subject=f"{topic}-key", version=1, data=schema_2_data)
+            subject=f"{topic}-key", version=1, data=schema2_data)
         assert result_raw.status_code == requests.codes.ok
-        assert result_raw.json()["is_compatible"] == True
+        assert orjson.loads(result_raw.content)["is_compatible"] == True
 
         self.logger.debug("Set subject config - BACKWARD")
         result_raw = self._set_config_subject(
             subject=f"{topic}-key",
-            data=json.dumps({"compatibility": "BACKWARD"}))
+            data=orjson.dumps({"compatibility": "BACKWARD"}))
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Check compatibility backward, with default")
         result_raw = self._post_compatibility_subject_version(
-            subject=f"{topic}-key", version=1, data=schema_2_data)
+            subject=f"{topic}-key", version=1, data=schema2_data)
         assert result_raw.status_code == requests.codes.ok
-        assert result_raw.json()["is_compatible"] == True
+        assert orjson.loads(result_raw.content)["is_compatible"] == True
 
         self.logger.debug("Check compatibility backward, no default")
         result_raw = self._post_compatibility_subject_version(
-            subject=f"{topic}-key", version=1, data=schema_3_data)
+            subject=f"{topic}-key", version=1, data=schema3_data)
         assert result_raw.status_code == requests.codes.ok
-        assert result_raw.json()["is_compatible"] == False
+        assert orjson.loads(result_raw.content)["is_compatible"] == False
 
     @cluster(num_nodes=3)
     def test_delete_subject(self):
@@ -378,32 +444,27 @@ class SchemaRegistryTest(RedpandaTest):
 
         topic = create_topic_names(1)[0]
 
-        self.logger.debug(f"Register a schema against a subject")
-        schema_1_data = json.dumps({"schema": schema1_def})
-        schema_2_data = json.dumps({"schema": schema2_def})
-        schema_3_data = json.dumps({"schema": schema3_def})
-
         self.logger.debug("Posting schema 1 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
+            subject=f"{topic}-key", data=schema1_data)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Set subject config - NONE")
         result_raw = self._set_config_subject(subject=f"{topic}-key",
-                                              data=json.dumps(
+                                              data=orjson.dumps(
                                                   {"compatibility": "NONE"}))
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Posting schema 2 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_2_data)
+            subject=f"{topic}-key", data=schema2_data)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Posting schema 3 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_3_data)
+            subject=f"{topic}-key", data=schema3_data)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
 
@@ -429,7 +490,7 @@ class SchemaRegistryTest(RedpandaTest):
             subject=f"{topic}-key", deleted=True)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
-        assert result_raw.json() == [1, 2, 3]
+        assert orjson.loads(result_raw.content) == [1, 2, 3]
 
         self.logger.debug("Permanently delete subject")
         result_raw = self._delete_subject(subject=f"{topic}-key",
@@ -445,32 +506,27 @@ class SchemaRegistryTest(RedpandaTest):
 
         topic = create_topic_names(1)[0]
 
-        self.logger.debug(f"Register a schema against a subject")
-        schema_1_data = json.dumps({"schema": schema1_def})
-        schema_2_data = json.dumps({"schema": schema2_def})
-        schema_3_data = json.dumps({"schema": schema3_def})
-
         self.logger.debug("Posting schema 1 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_1_data)
+            subject=f"{topic}-key", data=schema1_data)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Set subject config - NONE")
         result_raw = self._set_config_subject(subject=f"{topic}-key",
-                                              data=json.dumps(
+                                              data=orjson.dumps(
                                                   {"compatibility": "NONE"}))
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Posting schema 2 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_2_data)
+            subject=f"{topic}-key", data=schema2_data)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
 
         self.logger.debug("Posting schema 3 as a subject key")
         result_raw = self._post_subjects_subject_versions(
-            subject=f"{topic}-key", data=schema_3_data)
+            subject=f"{topic}-key", data=schema3_data)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
 
@@ -494,11 +550,11 @@ class SchemaRegistryTest(RedpandaTest):
             subject=f"{topic}-key")
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
-        assert result_raw.json() == [1, 3]
+        assert orjson.loads(result_raw.content) == [1, 3]
 
         self.logger.debug("Get versions - include deleted")
         result_raw = self._get_subjects_subject_versions(
             subject=f"{topic}-key", deleted=True)
         self.logger.debug(result_raw)
         assert result_raw.status_code == requests.codes.ok
-        assert result_raw.json() == [1, 2, 3]
+        assert orjson.loads(result_raw.content) == [1, 2, 3]
@@ -17,7 +17,7 @@ class BackgroundTask:
     exceptions thrown on a background thread to the callers thread.
     """
     def __init__(self):
-        self._done = False
+        self._done = threading.Event()
         self._error = None
         self._lock = threading.Lock()
         self._worker = threading.Thread(name=self.task_name(),
@@ -40,19 +40,23 @@ class BackgroundTask:
                 self._error = f"{threading.currentThread().name}:  {tb}"
             raise
         finally:
-            with self._lock:
-                self._done = True
+            self._done.set()
 
     def is_finished(self):
-        with self._lock:
-            return self._done
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Block until the task has finished or timeout seconds have elapsed.
+        Returns True if the task finished.
+        """
+        return self._done.wait(timeout)
 
     def start(self):
         self._worker.start()
 
     def stop(self):
-        with self._lock:
-            self._done = True
+        self._done.set()
 
     def join(self):
         self._worker.join()
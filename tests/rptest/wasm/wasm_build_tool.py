@@ -27,19 +27,6 @@ class WasmTemplateRepository:
         return None
 
 
-class DirectoryContext():
-    def __init__(self, directory):
-        self._directory = directory
-        self._orig_dir = None
-
-    def __enter__(self):
-        self._orig_dir = os.getcwd()
-        os.chdir(self._directory)
-
-    def __exit__(self, type, value, traceback):
-        os.chdir(self._orig_dir)
-
-
 class WasmBuildTool():
     def __init__(self, rpk_tool):
         self._rpk_tool = rpk_tool
@@ -62,9 +49,10 @@ class WasmBuildTool():
         return t.render(input_topics=inputs, output_topics=outputs)
 
     def _build_source(self, artifact_dir):
-        with DirectoryContext(artifact_dir) as _:
-            subprocess.run(["npm", "install"])
-            subprocess.run(["npm", "run", "build"])
+        # Run within artifact_dir via cwd rather than chdir'ing the whole
+        # process, so several scripts may be built concurrently
+        subprocess.run(["npm", "install"], cwd=artifact_dir)
+        subprocess.run(["npm", "run", "build"], cwd=artifact_dir)
 
     def build_test_artifacts(self, script):
         artifact_dir = os.path.join(self.work_dir, script.dir_name)
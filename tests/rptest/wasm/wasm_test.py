@@ -11,6 +11,7 @@ import os
 import uuid
 import random
 import string
+import time
 
 from kafka import TopicPartition
 
@@ -26,13 +27,18 @@ from rptest.tests.redpanda_test import RedpandaTest
 from rptest.clients.types import TopicSpec
 from rptest.clients.rpk import RpkTool
 
-from ducktape.utils.util import wait_until
+from ducktape.errors import TimeoutError
 
-from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+
+# Scripts commonly share output topics, memoize the name construction
+_materialized_topic = lru_cache(maxsize=1024)(construct_materialized_topic)
 
 
 def flat_map(fn, ll):
-    return reduce(lambda acc, x: acc + fn(x), ll, [])
+    return list(chain.from_iterable(fn(x) for x in ll))
 
 
 def random_string(N):
@@ -42,12 +48,12 @@ def random_string(N):
 
 
 class WasmScript:
-    def __init__(self, inputs=[], outputs=[], script=None):
+    def __init__(self, inputs=None, outputs=None, script=None):
         self.name = random_string(10)
-        self.inputs = inputs
-        self.outputs = outputs
+        self.inputs = inputs if inputs is not None else []
+        self.outputs = outputs if outputs is not None else []
         self.script = script
-        self.dir_name = str(uuid.uuid4())
+        self.dir_name = uuid.uuid4().hex
 
     def get_artifact(self, build_dir):
         artifact = os.path.join(build_dir, self.dir_name, "dist",
@@ -76,14 +82,16 @@ class WasmTest(RedpandaTest):
         self._output_consumer = None
         self._producers = None
 
-    def _build_script(self, script):
-        # Build the script itself
-        self._build_tool.build_test_artifacts(script)
+    def _build_scripts(self, scripts):
+        # Build the scripts themselves, builds are independent of one another
+        with ThreadPoolExecutor(max_workers=max(len(scripts), 1)) as ex:
+            list(ex.map(self._build_tool.build_test_artifacts, scripts))
 
-        # Deploy coprocessor
-        self._rpk_tool.wasm_deploy(
-            script.get_artifact(self._build_tool.work_dir), script.name,
-            "ducktape")
+        # Deploy coprocessors
+        for script in scripts:
+            self._rpk_tool.wasm_deploy(
+                script.get_artifact(self._build_tool.work_dir), script.name,
+                "ducktape")
 
     def restart_wasm_engine(self, node):
         self.logger.info(
@@ -103,32 +111,24 @@ class WasmTest(RedpandaTest):
             Must parse the materialzied topic for the input topic to determine
             the number of partitions.
             """
-            result = []
-            for src, _, _ in topic_spec:
-                materialized_topics = [
-                    TopicSpec(name=construct_materialized_topic(
-                        src.name, dest),
-                              partition_count=src.partition_count,
-                              replication_factor=src.replication_factor,
-                              cleanup_policy=src.cleanup_policy)
-                    for dest in output_topics
-                ]
-                result += materialized_topics
-            return result
+            return [
+                TopicSpec(name=_materialized_topic(src.name, dest),
+                          partition_count=src.partition_count,
+                          replication_factor=src.replication_factor,
+                          cleanup_policy=src.cleanup_policy)
+                for src, _, _ in topic_spec for dest in output_topics
+            ]
 
         def expand_topic_spec(etc):
             """
             Convers a TopicSpec iterable to a TopicPartitions list
             """
-            return set(
-                flat_map(
-                    lambda spec: [
-                        TopicPartition(spec.name, x)
-                        for x in range(0, spec.partition_count)
-                    ], etc))
+            return {
+                TopicPartition(spec.name, x)
+                for spec in etc for x in range(0, spec.partition_count)
+            }
 
-        for script in scripts:
-            self._build_script(script)
+        self._build_scripts(scripts)
 
         input_tps = expand_topic_spec([x[0] for x in topic_spec])
         output_tps = expand_topic_spec(
@@ -136,31 +136,28 @@ class WasmTest(RedpandaTest):
                 flat_map(lambda script: script.outputs, scripts)))
 
         # Calcualte expected records on all inputs / outputs
-        total_inputs = reduce(lambda acc, x: acc + x[1], topic_spec, 0)
+        total_inputs = sum(x[1] for x in topic_spec)
 
-        def accrue(acc, output_topic):
-            src = get_source_topic(output_topic)
-            num_records = [x[1] for x in topic_spec if x[0].name == src]
-            assert (len(num_records) == 1)
-            return acc + num_records[0]
-
-        total_outputs = reduce(accrue, set([x.topic for x in output_tps]), 0)
+        source_records = {x[0].name: x[1] for x in topic_spec}
+        assert (len(source_records) == len(topic_spec))
+        output_topics = {x.topic for x in output_tps}
+        total_outputs = sum(source_records[get_source_topic(x)]
+                            for x in output_topics)
 
         self.logger.info(f"Input consumer assigned: {input_tps}")
         self.logger.info(f"Output consumer assigned: {output_tps}")
 
-        self._producers = []
-
-        for tp_spec, num_records, record_size in topic_spec:
-            try:
-                producer = NativeKafkaProducer(self.redpanda.brokers(),
-                                               tp_spec.name, num_records, 100,
-                                               record_size)
+        try:
+            self._producers = [
+                NativeKafkaProducer(self.redpanda.brokers(), tp_spec.name,
+                                    num_records, 100, record_size)
+                for tp_spec, num_records, record_size in topic_spec
+            ]
+            for producer in self._producers:
                 producer.start()
-                self._producers.append(producer)
-            except Exception as e:
-                self.logger.error(f"Failed to create NativeKafkaProducer: {e}")
-                raise
+        except Exception as e:
+            self.logger.error(f"Failed to create NativeKafkaProducer: {e}")
+            raise
 
         try:
             self._input_consumer = NativeKafkaConsumer(self.redpanda.brokers(),
@@ -179,7 +176,7 @@ class WasmTest(RedpandaTest):
         self._output_consumer.start()
 
     def wait_on_results(self):
-        def all_done():
+        def report_progress():
             # Uncomment to periodically see the amt of data read
             self.logger.info("Input: %d" %
                              self._input_consumer.results.num_records())
@@ -189,11 +186,16 @@ class WasmTest(RedpandaTest):
             if batch_total > 0:
                 self.records_recieved(batch_total)
 
-            return self._input_consumer.is_finished() \
-                and self._output_consumer.is_finished()
-
+        # Wake up as soon as each consumer finishes rather than polling,
+        # progress is still reported every backoff interval in between
         timeout, backoff = self.wasm_test_timeout()
-        wait_until(all_done, timeout_sec=timeout, backoff_sec=backoff)
+        deadline = time.monotonic() + timeout
+        for consumer in [self._input_consumer, self._output_consumer]:
+            while not consumer.wait(timeout=backoff):
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Consumers did not finish within {timeout} seconds")
+                report_progress()
         try:
             [x.join() for x in self._producers]
             self._input_consumer.join()
@@ -18,6 +18,7 @@ setup(
         'pyyaml==5.3.1',
         'kafka-python==2.0.2',
         'confluent-kafka==1.6.1',
+        'orjson==3.5.2',
     ],
     scripts=[],
 )